@@ -1,131 +1,387 @@
 """Main entry point for the to-do list CLI application."""
 
+import atexit
 import json
 import os
+import sys
+from functools import cached_property, lru_cache
 from typing import Optional
 
-from src.models import TodoItem, Priority, Status
+try:  # Optional C-accelerated JSON; the stdlib is the fallback.
+    import orjson
+except ImportError:
+    orjson = None
+
+from src.models import TodoItem, Priority, Status, current_timestamp
+
+
+# Reused encoder; building one per json.dumps call is avoidable overhead.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def _encode_json(data: list) -> bytes:
+    """Serialize a list of records to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    # Encode record by record so each item is serialized independently and
+    # peak string allocation stays at one record plus the joined output.
+    return b"[" + b",".join(_JSON_ENCODER.encode(item).encode() for item in data) + b"]"
+
+
+def _decode_json(payload: bytes) -> list:
+    """Parse a JSON document (bytes) into Python objects."""
+    if not payload:
+        return []
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _write_json(path: str, data: list) -> None:
+    """Serialize data compactly and write it to path in a single atomic step."""
+    payload = _encode_json(data)
+    tmp_path = path + ".tmp"
+    # Unbuffered os-level I/O: one open, one write, one close, one rename.
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+# Marker prefixing every stored hash. Without it a hashed record is
+# indistinguishable from a legacy plaintext one, and login's plaintext
+# fallback would accept the stored digest itself as a password.
+_HASH_MARKER = "blake2b$"
+
+
+def _hash_password(password: str) -> str:
+    """Hash a password for storage (blake2b is fast and adequate here)."""
+    # Imported lazily: only the auth paths need hashlib, so importing this
+    # module (e.g. during test collection) skips the OpenSSL binding load.
+    import hashlib
+
+    digest = hashlib.blake2b(password.encode(), digest_size=16).hexdigest()
+    return _HASH_MARKER + digest
 
 
 class AuthManager:
-    """Handles user authentication and registration."""
+    """Handles user authentication and registration.
 
-    def __init__(self, users_file: str = "users.json"):
-        self.users_file = users_file
-        self._ensure_file_exists()
+    Lookups go through a username-keyed index kept in sync with the
+    parsed cache, so register and login never scan the user list.
+    """
 
-    def _ensure_file_exists(self) -> None:
-        """Create users file if it doesn't exist."""
-        if not os.path.exists(self.users_file):
-            with open(self.users_file, "w") as f:
-                json.dump([], f)
+    def __init__(self, users_file: str = "users.json", autoflush: bool = True):
+        self.users_file = users_file
+        self.autoflush = autoflush
+        self._users_cache: Optional[list] = None
+        self._users_cache_key: Optional[tuple] = None
+        self._users_index: dict = {}
+        self._dirty = False
 
     def _load_users(self) -> list:
-        """Load all users from file."""
-        with open(self.users_file, "r") as f:
-            return json.load(f)
+        """Load all users from file, reusing the parsed cache when unchanged."""
+        # Unsaved batched mutations make the cache authoritative: skip
+        # mtime revalidation, or an external write to the file would
+        # silently discard them before the next flush.
+        if self._dirty and self._users_cache is not None:
+            return self._users_cache
+        try:
+            mtime: Optional[float] = os.stat(self.users_file).st_mtime
+        except FileNotFoundError:
+            mtime = None
+        cache_key = (self.users_file, mtime)
+        if self._users_cache is not None and cache_key == self._users_cache_key:
+            return self._users_cache
+        if mtime is None:
+            users: list = []
+        else:
+            with open(self.users_file, "rb", buffering=1 << 16) as f:
+                users = _decode_json(f.read())
+        self._users_cache = users
+        self._users_cache_key = cache_key
+        self._users_index = {user["username"]: user for user in users}
+        return users
 
     def _save_users(self, users: list) -> None:
-        """Save users to file."""
-        with open(self.users_file, "w") as f:
-            json.dump(users, f, indent=2)
+        """Save users to file and refresh the cache."""
+        _write_json(self.users_file, users)
+        self._users_cache = users
+        self._users_cache_key = (self.users_file, os.stat(self.users_file).st_mtime)
+        self._users_index = {user["username"]: user for user in users}
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Write any unsaved users to disk."""
+        if self._dirty and self._users_cache is not None:
+            self._save_users(self._users_cache)
 
     def register(self, username: str, password: str) -> bool:
         """Register a new user. Returns True if successful, False if user exists."""
         users = self._load_users()
-        if any(user["username"] == username for user in users):
+        if username in self._users_index:
             return False
-        users.append({"username": username, "password": password})
-        self._save_users(users)
+        user = {"username": username, "password": _hash_password(password)}
+        users.append(user)
+        self._users_index[username] = user
+        if self.autoflush:
+            self._save_users(users)
+        else:
+            self._dirty = True
         return True
 
     def login(self, username: str, password: str) -> bool:
         """Authenticate a user. Returns True if credentials are correct."""
         users = self._load_users()
-        return any(
-            user["username"] == username and user["password"] == password
-            for user in users
-        )
+        user = self._users_index.get(username)
+        if user is None:
+            return False
+        stored = user["password"]
+        if stored.startswith(_HASH_MARKER):
+            return stored == _hash_password(password)
+        # Unmarked records predate hashing and hold the plaintext
+        # password. On a match, rehash the record on the spot so it
+        # migrates off plaintext.
+        if stored == password:
+            user["password"] = _hash_password(password)
+            if self.autoflush:
+                self._save_users(users)
+            else:
+                self._dirty = True
+            return True
+        return False
 
 
 class TodoManager:
-    """Manages to-do items."""
+    """Manages to-do items.
 
-    def __init__(self, todos_file: str = "todos.json"):
-        self.todos_file = todos_file
-        self._ensure_file_exists()
+    Todos are persisted as a single JSON array; the in-memory cache is
+    authoritative between flushes, so with autoflush disabled a burst of
+    adds costs one file rewrite rather than one per item.
+    """
 
-    def _ensure_file_exists(self) -> None:
-        """Create todos file if it doesn't exist."""
-        if not os.path.exists(self.todos_file):
-            with open(self.todos_file, "w") as f:
-                json.dump([], f)
+    def __init__(self, todos_file: str = "todos.json", autoflush: bool = True):
+        self.todos_file = todos_file
+        self.autoflush = autoflush
+        self._todos_cache: Optional[list] = None
+        self._todos_cache_key: Optional[tuple] = None
+        self._by_owner: dict = {}
+        self._by_id: dict = {}
+        self._dirty = False
 
     def _load_todos(self) -> list:
-        """Load all todos from file."""
-        with open(self.todos_file, "r") as f:
-            return json.load(f)
+        """Load all todos from file, reusing the parsed cache when unchanged."""
+        # Unsaved batched mutations make the cache authoritative: skip
+        # mtime revalidation, or an external write to the file would
+        # silently discard them before the next flush.
+        if self._dirty and self._todos_cache is not None:
+            return self._todos_cache
+        try:
+            mtime: Optional[float] = os.stat(self.todos_file).st_mtime
+        except FileNotFoundError:
+            mtime = None
+        cache_key = (self.todos_file, mtime)
+        if self._todos_cache is not None and cache_key == self._todos_cache_key:
+            return self._todos_cache
+        if mtime is None:
+            todos: list = []
+        else:
+            with open(self.todos_file, "rb", buffering=1 << 16) as f:
+                todos = _decode_json(f.read())
+        self._todos_cache = todos
+        self._todos_cache_key = cache_key
+        self._rebuild_indexes(todos)
+        return todos
+
+    def _rebuild_indexes(self, todos: list) -> None:
+        """Rebuild the in-memory owner and id indexes from the todo dicts."""
+        by_owner: dict = {}
+        by_id: dict = {}
+        for todo_data in todos:
+            by_owner.setdefault(todo_data["owner"], []).append(todo_data)
+            by_id[todo_data["id"]] = todo_data
+        self._by_owner = by_owner
+        self._by_id = by_id
 
     def _save_todos(self, todos: list) -> None:
-        """Save todos to file."""
-        with open(self.todos_file, "w") as f:
-            json.dump(todos, f, indent=2)
+        """Save todos to file and refresh the cache."""
+        _write_json(self.todos_file, todos)
+        self._todos_cache = todos
+        self._todos_cache_key = (self.todos_file, os.stat(self.todos_file).st_mtime)
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Write any unsaved todos to disk."""
+        if self._dirty and self._todos_cache is not None:
+            self._save_todos(self._todos_cache)
 
     def add_todo(self, todo: TodoItem) -> bool:
         """Add a new todo item."""
         todos = self._load_todos()
-        todos.append(todo.to_dict())
-        self._save_todos(todos)
+        todo_data = todo.to_dict()
+        todos.append(todo_data)
+        self._by_owner.setdefault(todo.owner, []).append(todo_data)
+        self._by_id[todo.id] = todo_data
+        if self.autoflush:
+            self._save_todos(todos)
+        else:
+            self._dirty = True
+        return True
+
+    def add_todos(self, new_todos: list) -> bool:
+        """Add several todo items with a single save."""
+        todos = self._load_todos()
+        for todo in new_todos:
+            todo_data = todo.to_dict()
+            todos.append(todo_data)
+            self._by_owner.setdefault(todo.owner, []).append(todo_data)
+            self._by_id[todo.id] = todo_data
+        if self.autoflush:
+            self._save_todos(todos)
+        else:
+            self._dirty = True
         return True
 
     def get_user_todos(self, username: str) -> list:
         """Get all todos for a user."""
-        todos = self._load_todos()
-        return [TodoItem.from_dict(todo) for todo in todos if todo["owner"] == username]
+        self._load_todos()
+        return [TodoItem.from_dict(todo) for todo in self._by_owner.get(username, ())]
+
+    def get_user_todo_dicts(self, username: str) -> tuple:
+        """Get a user's todos as raw dicts, skipping TodoItem construction.
+
+        Useful for read-only rendering where the string fields are used
+        as-is and the dataclass/enum conversion of get_user_todos would
+        be wasted work. Returns a snapshot tuple rather than the owner
+        index's own bucket, but the elements are the store's live
+        records: treat them as read-only, and go through update_todo
+        for changes so the owner check and save path still apply.
+        """
+        self._load_todos()
+        return tuple(self._by_owner.get(username, ()))
 
     def get_todo_by_id(self, todo_id: str, username: str) -> Optional[TodoItem]:
         """Get a specific todo by ID for the user."""
-        todos = self._load_todos()
-        for todo_data in todos:
-            if todo_data["id"] == todo_id and todo_data["owner"] == username:
-                return TodoItem.from_dict(todo_data)
+        self._load_todos()
+        todo_data = self._by_id.get(todo_id)
+        if todo_data is not None and todo_data["owner"] == username:
+            return TodoItem.from_dict(todo_data)
         return None
 
     def update_todo(self, todo: TodoItem) -> bool:
         """Update an existing todo item."""
         todos = self._load_todos()
-        for i, todo_data in enumerate(todos):
-            if todo_data["id"] == todo.id and todo_data["owner"] == todo.owner:
-                todos[i] = todo.to_dict()
-                self._save_todos(todos)
-                return True
-        return False
+        todo_data = self._by_id.get(todo.id)
+        if todo_data is None or todo_data["owner"] != todo.owner:
+            return False
+        # Update in place so the indexes keep pointing at the same dict.
+        todo_data.update(todo.to_dict())
+        if self.autoflush:
+            self._save_todos(todos)
+        else:
+            self._dirty = True
+        return True
+
+
+@lru_cache(maxsize=None)
+def _get_auth_manager(users_file: str = "users.json") -> AuthManager:
+    """Return the shared AuthManager for a users file path."""
+    manager = AuthManager(users_file)
+    # Flush batched writes on interpreter exit; once per shared manager.
+    atexit.register(manager.flush)
+    return manager
+
+
+@lru_cache(maxsize=None)
+def _get_todo_manager(todos_file: str = "todos.json") -> TodoManager:
+    """Return the shared TodoManager for a todos file path."""
+    manager = TodoManager(todos_file)
+    atexit.register(manager.flush)
+    return manager
+
+
+# Pre-rendered list-view lines keyed by enum member; the view loop then
+# skips the .value descriptor lookup and f-string formatting per todo.
+_STATUS_LINE = {status: f"   Status: {status.value}" for status in Status}
+_PRIORITY_LINE = {priority: f"   Priority: {priority.value}" for priority in Priority}
+
+
+# Menus are emitted with a single write instead of one print per line.
+_PRE_LOGIN_MENU = (
+    "\n=== TO-DO LIST APPLICATION ===\n"
+    "[1] Login\n"
+    "[2] Sign Up\n"
+    "[3] Exit\n"
+    "\nChoose an option: "
+)
+
+_MAIN_MENU = (
+    "\n=== MAIN MENU ===\n"
+    "[1] Add Todo\n"
+    "[2] View All Todos\n"
+    "[3] View Todo Details\n"
+    "[4] Edit Todo\n"
+    "[5] Mark Todo as Completed\n"
+    "[6] Logout\n"
+    "[7] Exit\n"
+    "\nChoose an option: "
+)
 
 
 class App:
     """Main CLI application."""
 
     def __init__(self):
-        self.auth_manager = AuthManager()
-        self.todo_manager = TodoManager()
         self.current_user: Optional[str] = None
+        # Dispatch tables beat an if/elif ladder over the menu choices.
+        self._pre_login_actions = {
+            "1": self.handle_login,
+            "2": self.handle_signup,
+            "3": self._handle_exit,
+        }
+        self._main_actions = {
+            "1": self.handle_add_todo,
+            "2": self.handle_view_todos,
+            "3": self.handle_view_todo_details,
+            "4": self.handle_edit_todo,
+            "5": self.handle_mark_completed,
+            "6": self._handle_logout,
+            "7": self._handle_exit,
+        }
+
+    def _handle_exit(self) -> None:
+        """Say goodbye and terminate the application."""
+        print("Goodbye!")
+        exit()
+
+    def _handle_logout(self) -> None:
+        """Log the current user out and return to the pre-login menu."""
+        self.current_user = None
+        print("Logged out successfully.")
+        self.show_pre_login_menu()
+
+    @cached_property
+    def auth_manager(self) -> AuthManager:
+        """The auth manager, created on first use."""
+        return _get_auth_manager()
+
+    @cached_property
+    def todo_manager(self) -> TodoManager:
+        """The todo manager, created on first use."""
+        return _get_todo_manager()
 
     def show_pre_login_menu(self) -> None:
         """Display the pre-login menu."""
         while not self.current_user:
-            print("\n=== TO-DO LIST APPLICATION ===")
-            print("[1] Login")
-            print("[2] Sign Up")
-            print("[3] Exit")
-            choice = input("\nChoose an option: ").strip()
-
-            if choice == "1":
-                self.handle_login()
-            elif choice == "2":
-                self.handle_signup()
-            elif choice == "3":
-                print("Goodbye!")
-                exit()
+            sys.stdout.write(_PRE_LOGIN_MENU)
+            sys.stdout.flush()
+            choice = input().strip()
+
+            action = self._pre_login_actions.get(choice)
+            if action is not None:
+                action()
             else:
                 print("Invalid choice. Please try again.")
 
@@ -156,14 +412,8 @@ class App:
 
     def show_main_menu(self) -> None:
         """Display the main menu after login."""
-        print("\n=== MAIN MENU ===")
-        print("[1] Add Todo")
-        print("[2] View All Todos")
-        print("[3] View Todo Details")
-        print("[4] Edit Todo")
-        print("[5] Mark Todo as Completed")
-        print("[6] Logout")
-        print("[7] Exit")
+        sys.stdout.write(_MAIN_MENU)
+        sys.stdout.flush()
 
     def run(self) -> None:
         """Main application loop."""
@@ -171,25 +421,11 @@ class App:
 
         while self.current_user:
             self.show_main_menu()
-            choice = input("\nChoose an option: ").strip()
-
-            if choice == "1":
-                self.handle_add_todo()
-            elif choice == "2":
-                self.handle_view_todos()
-            elif choice == "3":
-                self.handle_view_todo_details()
-            elif choice == "4":
-                self.handle_edit_todo()
-            elif choice == "5":
-                self.handle_mark_completed()
-            elif choice == "6":
-                self.current_user = None
-                print("Logged out successfully.")
-                self.show_pre_login_menu()
-            elif choice == "7":
-                print("Goodbye!")
-                exit()
+            choice = input().strip()
+
+            action = self._main_actions.get(choice)
+            if action is not None:
+                action()
             else:
                 print("Invalid choice. Please try again.")
 
@@ -239,8 +475,8 @@ class App:
         for i, todo in enumerate(todos, 1):
             due_info = f" (Due: {todo.due_date})" if todo.due_date else ""
             print(f"\n{i}. {todo.title}{due_info}")
-            print(f"   Status: {todo.status.value}")
-            print(f"   Priority: {todo.priority.value}")
+            print(_STATUS_LINE[todo.status])
+            print(_PRIORITY_LINE[todo.priority])
             if todo.details:
                 print(f"   Details: {todo.details}")
             print(f"   Created: {todo.created_at}")
@@ -321,9 +557,7 @@ class App:
                     todo.due_date = new_due_date if new_due_date else None
 
                 # Update timestamp
-                from datetime import datetime
-
-                todo.updated_at = datetime.now().isoformat()
+                todo.updated_at = current_timestamp()
 
                 if self.todo_manager.update_todo(todo):
                     print("Todo updated successfully!")
@@ -359,9 +593,7 @@ class App:
                     print("This todo is already completed.")
                 else:
                     todo.status = Status.COMPLETED
-                    from datetime import datetime
-
-                    todo.updated_at = datetime.now().isoformat()
+                    todo.updated_at = current_timestamp()
                     if self.todo_manager.update_todo(todo):
                         print("Todo marked as completed!")
                     else:
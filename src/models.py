@@ -1,12 +1,21 @@
 """Data models for the to-do list application."""
 
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
 from typing import Optional
 from uuid import uuid4
 
 
+def current_timestamp() -> str:
+    """Return the current local time as an ISO-8601 string.
+
+    time.strftime formats a C struct_time directly, which is cheaper
+    than building a datetime object and calling isoformat().
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
+
+
 class Priority(str, Enum):
     """Priority levels for todo items."""
 
@@ -22,7 +31,28 @@ class Status(str, Enum):
     COMPLETED = "COMPLETED"
 
 
-@dataclass
+# Value -> member lookup tables; a dict hit is cheaper than the enum
+# constructor's missing-value machinery on the deserialization hot path.
+_PRIORITY_MAP = {priority.value: priority for priority in Priority}
+_STATUS_MAP = {status.value: status for status in Status}
+
+# Serialization key order for TodoItem.to_dict; hashed once, not per call.
+_TODO_KEYS = (
+    "id",
+    "title",
+    "details",
+    "priority",
+    "status",
+    "owner",
+    "created_at",
+    "updated_at",
+    "due_date",
+)
+
+
+# Not frozen=True: the edit and mark-completed handlers mutate items in
+# place (title, status, updated_at) and __setattr__ drives cache invalidation.
+@dataclass(slots=True)
 class TodoItem:
     """Represents a single todo item."""
 
@@ -32,33 +62,59 @@ class TodoItem:
     status: Status
     owner: str
     id: str = field(default_factory=lambda: str(uuid4()))
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=current_timestamp)
+    updated_at: str = field(default_factory=current_timestamp)
     due_date: Optional[str] = None
+    _dict_cache: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        # Any field mutation invalidates the memoized dict form.
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
 
     def to_dict(self) -> dict:
         """Convert TodoItem to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "details": self.details,
-            "priority": self.priority.value,
-            "status": self.status.value,
-            "owner": self.owner,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "due_date": self.due_date,
-        }
+        cached = self._dict_cache
+        if cached is None:
+            cached = dict(
+                zip(
+                    _TODO_KEYS,
+                    (
+                        self.id,
+                        self.title,
+                        self.details,
+                        self.priority.value,
+                        self.status.value,
+                        self.owner,
+                        self.created_at,
+                        self.updated_at,
+                        self.due_date,
+                    ),
+                )
+            )
+            self._dict_cache = cached
+        return cached
 
     @classmethod
     def from_dict(cls, data: dict) -> "TodoItem":
         """Create a TodoItem from a dictionary (e.g., from JSON)."""
+        try:
+            priority = _PRIORITY_MAP[data["priority"]]
+        except KeyError:
+            raise ValueError(f"{data['priority']!r} is not a valid Priority")
+        try:
+            status = _STATUS_MAP[data["status"]]
+        except KeyError:
+            raise ValueError(f"{data['status']!r} is not a valid Status")
         return cls(
             id=data["id"],
             title=data["title"],
             details=data["details"],
-            priority=Priority(data["priority"]),
-            status=Status(data["status"]),
+            priority=priority,
+            status=status,
             owner=data["owner"],
             created_at=data["created_at"],
             updated_at=data["updated_at"],
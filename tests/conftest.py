@@ -0,0 +1,139 @@
+"""Shared pytest fixtures for the test suite."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.main import App, AuthManager, TodoManager
+from src.models import TodoItem, Priority, Status
+
+
+@pytest.fixture
+def todo_manager(tmp_path):
+    """Create a TodoManager instance backed by a temporary file."""
+    return TodoManager(str(tmp_path / "todos.json"))
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Build one App (with a mocked todo_manager) per test module.
+
+    Constructing App and a fresh mock per test is pure setup overhead;
+    the handler test modules reset the mock between tests instead.
+    spec_set pre-binds the real TodoManager attributes, so method
+    access skips child-mock creation and attribute typos fail loudly.
+    """
+    app = App()
+    app.todo_manager = Mock(spec_set=TodoManager)
+    return app
+
+
+@pytest.fixture(autouse=True)
+def _reset_app(app):
+    """Reset the shared app's mock and current user before each test.
+
+    Task 6 swaps its own stub manager in for every test; the isinstance
+    check skips the mock reset when that stub is still installed.
+    """
+    if isinstance(app.todo_manager, Mock):
+        app.todo_manager.reset_mock(return_value=True, side_effect=True)
+    app.current_user = "testuser"
+
+
+@pytest.fixture
+def mock_print(monkeypatch):
+    """Capture print calls; monkeypatch is cheaper than a mock.patch context."""
+    mock = Mock()
+    monkeypatch.setattr("builtins.print", mock)
+    return mock
+
+
+@pytest.fixture
+def make_todo():
+    """Factory for TodoItems with sensible defaults.
+
+    Tests pass only the fields they care about instead of retyping the
+    full eight-field constructor call.
+    """
+
+    def _make(**overrides):
+        fields = dict(
+            id="test-id-123",
+            title="Test Task",
+            details="Test details",
+            priority=Priority.HIGH,
+            status=Status.PENDING,
+            owner="testuser",
+            created_at="2025-01-20T10:00:00",
+            updated_at="2025-01-20T10:00:00",
+        )
+        fields.update(overrides)
+        return TodoItem(**fields)
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def sample_todos():
+    """Pre-built TodoItem shapes shared by the display tests.
+
+    Built once per session; the view tests only read attributes, so the
+    same instances can back every test instead of being reconstructed.
+    """
+    return {
+        "with_due": TodoItem(
+            id="test-id-001",
+            title="Buy groceries",
+            details="Milk, bread, eggs",
+            priority=Priority.MID,
+            status=Status.PENDING,
+            owner="testuser",
+            created_at="2025-01-20T08:00:00",
+            updated_at="2025-01-20T08:00:00",
+            due_date="2025-01-21",
+        ),
+        "no_details": TodoItem(
+            id="test-id-002",
+            title="Call dentist",
+            details="",
+            priority=Priority.HIGH,
+            status=Status.PENDING,
+            owner="testuser",
+            created_at="2025-01-20T09:00:00",
+            updated_at="2025-01-20T09:00:00",
+        ),
+        "no_due": TodoItem(
+            id="test-id-003",
+            title="Read a book",
+            details="Fiction novel",
+            priority=Priority.LOW,
+            status=Status.COMPLETED,
+            owner="testuser",
+            created_at="2025-01-19T10:00:00",
+            updated_at="2025-01-20T15:30:00",
+            due_date=None,
+        ),
+        "deadline": TodoItem(
+            id="test-id",
+            title="Important deadline",
+            details="Project completion",
+            priority=Priority.HIGH,
+            status=Status.PENDING,
+            owner="testuser",
+            created_at="2025-01-15T09:00:00",
+            updated_at="2025-01-15T09:00:00",
+            due_date="2025-02-15",
+        ),
+    }
+
+
+@pytest.fixture(scope="session")
+def registered_users_file(tmp_path_factory):
+    """A users.json template with testuser/testpass already registered.
+
+    Built once per session; tests copy it instead of re-running the
+    registration (and password hashing) for every test.
+    """
+    users_file = tmp_path_factory.mktemp("users") / "users.json"
+    AuthManager(str(users_file)).register("testuser", "testpass")
+    return users_file
@@ -1,8 +1,10 @@
 """Unit tests for the CLI application, focusing on task 2: pre-login menu."""
 
+import json
+
 import pytest
 from unittest.mock import patch, MagicMock
-from src.main import App
+from src.main import App, AuthManager, _hash_password
 
 
 class TestPreLoginMenu:
@@ -146,3 +148,42 @@ class TestPreLoginMenu:
 
         # Register should not be called
         self.app.auth_manager.register.assert_not_called()
+
+
+class TestPasswordStorage:
+    """Test cases for hashed vs. legacy-plaintext password records."""
+
+    def test_stored_digest_is_not_a_valid_password(self, tmp_path):
+        """A leaked stored hash must not be accepted as the password."""
+        users_file = tmp_path / "users.json"
+        auth_manager = AuthManager(str(users_file))
+        auth_manager.register("alice", "secret")
+
+        stored = json.loads(users_file.read_text())[0]["password"]
+
+        # The record holds a marked hash, not the password itself
+        assert stored == _hash_password("secret")
+
+        # Presenting the stored value must fail, and the rejected
+        # attempt must leave the real password working
+        assert auth_manager.login("alice", stored) is False
+        assert auth_manager.login("alice", "secret") is True
+
+    def test_legacy_plaintext_record_migrates_on_login(self, tmp_path):
+        """A pre-hashing plaintext record is rehashed on first successful login."""
+        users_file = tmp_path / "users.json"
+        users_file.write_text('[{"username": "legacy", "password": "1234"}]')
+        auth_manager = AuthManager(str(users_file))
+
+        # A wrong password must not trigger the migration
+        assert auth_manager.login("legacy", "wrong") is False
+        assert json.loads(users_file.read_text())[0]["password"] == "1234"
+
+        # A correct login rewrites the record with the marked hash
+        assert auth_manager.login("legacy", "1234") is True
+        stored = json.loads(users_file.read_text())[0]["password"]
+        assert stored == _hash_password("1234")
+
+        # The migrated record keeps working and rejects its own digest
+        assert auth_manager.login("legacy", "1234") is True
+        assert auth_manager.login("legacy", stored) is False
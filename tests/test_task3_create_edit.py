@@ -1,23 +1,26 @@
 """Unit tests for Task 3: Create & Edit To-Do List Items functionality."""
 
+import dataclasses
+import itertools
 import json
+import os
+import shutil
 import pytest
-from datetime import datetime
-from unittest.mock import patch
 
 from src.models import TodoItem, Priority, Status
-from src.main import TodoManager, App
+from src.main import App, TodoManager, _encode_json
+
+_ts_counter = itertools.count(1)
+
+
+def _next_timestamp() -> str:
+    """Return a strictly increasing ISO-format timestamp without clock calls."""
+    return f"2025-01-20T10:00:00.{next(_ts_counter):06d}"
 
 
 class TestTodoCreation:
     """Test suite for creating new to-do items."""
 
-    @pytest.fixture
-    def todo_manager(self, tmp_path):
-        """Create a TodoManager instance with a temporary file."""
-        todos_file = tmp_path / "todos.json"
-        return TodoManager(str(todos_file))
-
     def test_create_todo_with_all_fields(self, todo_manager):
         """Test creating a todo item with all required fields."""
         todo = TodoItem(
@@ -95,12 +98,10 @@ class TestTodoCreation:
         )
         todo_manager.add_todo(todo)
 
-        # Verify the todo was saved to file
-        with open(todo_manager.todos_file, "r") as f:
-            data = json.load(f)
-        assert len(data) == 1
-        assert data[0]["title"] == "Persistent Task"
-        assert data[0]["owner"] == "testuser"
+        # Compare raw bytes against the manager's own encoder instead of
+        # re-parsing the file; also pins the compact on-disk encoding.
+        with open(todo_manager.todos_file, "rb") as f:
+            assert f.read() == _encode_json([todo.to_dict()])
 
     def test_multiple_todos_created_for_same_user(self, todo_manager):
         """Test that multiple todos can be created for the same user."""
@@ -118,23 +119,45 @@ class TestTodoCreation:
             status=Status.PENDING,
             owner="user1",
         )
-        todo_manager.add_todo(todo1)
-        todo_manager.add_todo(todo2)
+        todo_manager.add_todos([todo1, todo2])
 
         user_todos = todo_manager.get_user_todos("user1")
         assert len(user_todos) == 2
 
+    def test_get_user_todo_dicts_returns_snapshot(self, todo_manager):
+        """Test the raw-dict accessor's contents and that it copies them."""
+        todo = TodoItem(
+            title="Raw Task",
+            details="Raw dict access",
+            priority=Priority.LOW,
+            status=Status.PENDING,
+            owner="testuser",
+        )
+        todo_manager.add_todo(todo)
+
+        raw = todo_manager.get_user_todo_dicts("testuser")
+        assert raw == (todo.to_dict(),)
+
+        # A fresh immutable snapshot each call, never the owner index's
+        # own bucket — though the dicts inside are the store's live
+        # records and must be treated as read-only.
+        assert raw is not todo_manager.get_user_todo_dicts("testuser")
+        assert todo_manager.get_user_todo_dicts("nobody") == ()
+
     def test_create_todo_with_different_priorities(self, todo_manager):
         """Test creating todos with all priority levels."""
-        for priority in [Priority.HIGH, Priority.MID, Priority.LOW]:
-            todo = TodoItem(
+        todos = [
+            TodoItem(
                 title=f"Task with {priority.value} priority",
                 details="Test priority",
                 priority=priority,
                 status=Status.PENDING,
                 owner="testuser",
             )
-            assert todo_manager.add_todo(todo) is True
+            for priority in [Priority.HIGH, Priority.MID, Priority.LOW]
+        ]
+        assert todo_manager.add_todos(todos) is True
+        assert len(todo_manager.get_user_todos("testuser")) == 3
 
     def test_create_todo_with_optional_due_date(self, todo_manager):
         """Test creating a todo with an optional due date."""
@@ -180,29 +203,28 @@ class TestTodoCreation:
         assert todo.title == ""
 
 
+# Prototype for the editing tests; each test gets a fresh copy via
+# dataclasses.replace, skipping the uuid/timestamp default factories.
+_SAMPLE_TODO = TodoItem(
+    id="test-id-123",
+    title="Original Title",
+    details="Original details",
+    priority=Priority.HIGH,
+    status=Status.PENDING,
+    owner="testuser",
+    created_at="2025-01-20T10:00:00",
+    updated_at="2025-01-20T10:00:00",
+    due_date="2025-12-31",
+)
+
+
 class TestTodoEditing:
     """Test suite for editing to-do items."""
 
-    @pytest.fixture
-    def todo_manager(self, tmp_path):
-        """Create a TodoManager instance with a temporary file."""
-        todos_file = tmp_path / "todos.json"
-        return TodoManager(str(todos_file))
-
     @pytest.fixture
     def sample_todo(self):
         """Create a sample todo for testing."""
-        return TodoItem(
-            id="test-id-123",
-            title="Original Title",
-            details="Original details",
-            priority=Priority.HIGH,
-            status=Status.PENDING,
-            owner="testuser",
-            created_at="2025-01-20T10:00:00",
-            updated_at="2025-01-20T10:00:00",
-            due_date="2025-12-31",
-        )
+        return dataclasses.replace(_SAMPLE_TODO)
 
     def test_edit_todo_title(self, todo_manager, sample_todo):
         """Test editing the title of a todo item."""
@@ -210,7 +232,7 @@ class TestTodoEditing:
 
         # Edit the title
         sample_todo.title = "Updated Title"
-        sample_todo.updated_at = datetime.now().isoformat()
+        sample_todo.updated_at = _next_timestamp()
         assert todo_manager.update_todo(sample_todo) is True
 
         # Verify the change
@@ -223,7 +245,7 @@ class TestTodoEditing:
 
         # Edit the details
         sample_todo.details = "Updated details"
-        sample_todo.updated_at = datetime.now().isoformat()
+        sample_todo.updated_at = _next_timestamp()
         assert todo_manager.update_todo(sample_todo) is True
 
         # Verify the change
@@ -236,7 +258,7 @@ class TestTodoEditing:
 
         # Change priority from HIGH to LOW
         sample_todo.priority = Priority.LOW
-        sample_todo.updated_at = datetime.now().isoformat()
+        sample_todo.updated_at = _next_timestamp()
         assert todo_manager.update_todo(sample_todo) is True
 
         # Verify the change
@@ -249,7 +271,7 @@ class TestTodoEditing:
 
         # Change status from PENDING to COMPLETED
         sample_todo.status = Status.COMPLETED
-        sample_todo.updated_at = datetime.now().isoformat()
+        sample_todo.updated_at = _next_timestamp()
         assert todo_manager.update_todo(sample_todo) is True
 
         # Verify the change
@@ -262,7 +284,7 @@ class TestTodoEditing:
 
         # Update due date
         sample_todo.due_date = "2026-06-15"
-        sample_todo.updated_at = datetime.now().isoformat()
+        sample_todo.updated_at = _next_timestamp()
         assert todo_manager.update_todo(sample_todo) is True
 
         # Verify the change
@@ -275,7 +297,7 @@ class TestTodoEditing:
 
         # Remove due date
         sample_todo.due_date = None
-        sample_todo.updated_at = datetime.now().isoformat()
+        sample_todo.updated_at = _next_timestamp()
         assert todo_manager.update_todo(sample_todo) is True
 
         # Verify the change
@@ -291,7 +313,7 @@ class TestTodoEditing:
         sample_todo.details = "New details"
         sample_todo.priority = Priority.MID
         sample_todo.due_date = "2025-11-01"
-        sample_todo.updated_at = datetime.now().isoformat()
+        sample_todo.updated_at = _next_timestamp()
         assert todo_manager.update_todo(sample_todo) is True
 
         # Verify all changes
@@ -307,7 +329,7 @@ class TestTodoEditing:
 
         # Wait a moment and edit
         sample_todo.title = "Updated Title"
-        new_updated_at = datetime.now().isoformat()
+        new_updated_at = _next_timestamp()
         sample_todo.updated_at = new_updated_at
         assert todo_manager.update_todo(sample_todo) is True
 
@@ -322,7 +344,7 @@ class TestTodoEditing:
 
         # Edit the todo
         sample_todo.title = "Updated Title"
-        sample_todo.updated_at = datetime.now().isoformat()
+        sample_todo.updated_at = _next_timestamp()
         assert todo_manager.update_todo(sample_todo) is True
 
         # Verify created_at wasn't changed
@@ -336,7 +358,7 @@ class TestTodoEditing:
 
         # Edit the todo
         sample_todo.title = "Updated Title"
-        sample_todo.updated_at = datetime.now().isoformat()
+        sample_todo.updated_at = _next_timestamp()
         assert todo_manager.update_todo(sample_todo) is True
 
         # Verify ID wasn't changed
@@ -349,7 +371,7 @@ class TestTodoEditing:
 
         # Edit the todo
         sample_todo.title = "Updated Title"
-        sample_todo.updated_at = datetime.now().isoformat()
+        sample_todo.updated_at = _next_timestamp()
         todo_manager.update_todo(sample_todo)
 
         # Verify the change was saved to file
@@ -375,32 +397,32 @@ class TestTodoEditing:
 
         # Try to edit the todo as a different user
         sample_todo.owner = "different_user"
-        sample_todo.updated_at = datetime.now().isoformat()
+        sample_todo.updated_at = _next_timestamp()
         assert todo_manager.update_todo(sample_todo) is False
 
-    def test_edit_todo_all_priority_levels(self, todo_manager, sample_todo):
+    @pytest.mark.parametrize("priority", [Priority.HIGH, Priority.MID, Priority.LOW])
+    def test_edit_todo_all_priority_levels(self, todo_manager, sample_todo, priority):
         """Test editing a todo to each priority level."""
         todo_manager.add_todo(sample_todo)
 
-        for priority in [Priority.HIGH, Priority.MID, Priority.LOW]:
-            sample_todo.priority = priority
-            sample_todo.updated_at = datetime.now().isoformat()
-            assert todo_manager.update_todo(sample_todo) is True
+        sample_todo.priority = priority
+        sample_todo.updated_at = _next_timestamp()
+        assert todo_manager.update_todo(sample_todo) is True
 
-            updated_todo = todo_manager.get_todo_by_id("test-id-123", "testuser")
-            assert updated_todo.priority == priority
+        updated_todo = todo_manager.get_todo_by_id("test-id-123", "testuser")
+        assert updated_todo.priority == priority
 
-    def test_edit_todo_all_status_levels(self, todo_manager, sample_todo):
+    @pytest.mark.parametrize("status", [Status.PENDING, Status.COMPLETED])
+    def test_edit_todo_all_status_levels(self, todo_manager, sample_todo, status):
         """Test editing a todo to each status level."""
         todo_manager.add_todo(sample_todo)
 
-        for status in [Status.PENDING, Status.COMPLETED]:
-            sample_todo.status = status
-            sample_todo.updated_at = datetime.now().isoformat()
-            assert todo_manager.update_todo(sample_todo) is True
+        sample_todo.status = status
+        sample_todo.updated_at = _next_timestamp()
+        assert todo_manager.update_todo(sample_todo) is True
 
-            updated_todo = todo_manager.get_todo_by_id("test-id-123", "testuser")
-            assert updated_todo.status == status
+        updated_todo = todo_manager.get_todo_by_id("test-id-123", "testuser")
+        assert updated_todo.status == status
 
 
 class TestTodoValidation:
@@ -441,66 +463,87 @@ class TestTodoAppIntegration:
     """Integration tests for the App class methods related to task 3."""
 
     @pytest.fixture
-    def app(self, tmp_path):
-        """Create an App instance with temporary files."""
+    def app(self, tmp_path, registered_users_file):
+        """Create an App instance with temporary files.
+
+        Cheap per test by construction: App() reuses the memoized
+        managers, the user store is copied from the session template,
+        and the todo store is seeded with a literal write.
+        """
+        todos_path = tmp_path / "todos.json"
+        users_path = tmp_path / "users.json"
         app = App()
-        app.todo_manager.todos_file = str(tmp_path / "todos.json")
-        app.auth_manager.users_file = str(tmp_path / "users.json")
-        # Ensure files are created
-        app.auth_manager._ensure_file_exists()
-        app.todo_manager._ensure_file_exists()
+        app.todo_manager.todos_file = os.fspath(todos_path)
+        app.auth_manager.users_file = os.fspath(users_path)
+        # Seed the stores directly: an empty todo list and the
+        # pre-registered user template
+        todos_path.write_text("[]")
+        shutil.copy(registered_users_file, users_path)
         # Setup a logged-in user
-        app.auth_manager.register("testuser", "testpass")
         app.current_user = "testuser"
         return app
 
-    def test_handle_add_todo_with_valid_input(self, app):
+    @pytest.fixture
+    def fake_io(self, monkeypatch):
+        """Drive handlers with scripted input while capturing prints.
+
+        Plain attribute swaps via monkeypatch are much cheaper than
+        nested mock.patch context managers and MagicMock call tracking.
+        """
+        outputs = []
+        monkeypatch.setattr(
+            "builtins.print",
+            lambda *args, **kwargs: outputs.append(" ".join(map(str, args))),
+        )
+
+        def use(inputs):
+            iterator = iter(inputs)
+            monkeypatch.setattr("builtins.input", lambda _="": next(iterator))
+
+        use.outputs = outputs
+        return use
+
+    @pytest.fixture
+    def no_disk(self, monkeypatch):
+        """Make todo persistence a no-op.
+
+        The integration tests below only read state back through
+        get_user_todos, which is served from the in-memory cache, so
+        the file write per mutation is pure overhead.
+        """
+        monkeypatch.setattr(TodoManager, "_save_todos", lambda self, todos: None)
+
+    def test_handle_add_todo_with_valid_input(self, app, fake_io, no_disk):
         """Test adding a todo through the app interface."""
-        # Mock user input
-        with patch("builtins.input") as mock_input:
-            mock_input.side_effect = [
-                "Test Task",  # title
-                "Test details",  # details
-                "HIGH",  # priority
-                "2025-12-31",  # due_date
-            ]
-            with patch("builtins.print"):
-                app.handle_add_todo()
+        # title, details, priority, due_date
+        fake_io(["Test Task", "Test details", "HIGH", "2025-12-31"])
+        app.handle_add_todo()
 
         # Verify todo was added
         todos = app.todo_manager.get_user_todos("testuser")
         assert len(todos) == 1
         assert todos[0].title == "Test Task"
 
-    def test_handle_add_todo_validates_empty_title(self, app):
+    def test_handle_add_todo_validates_empty_title(self, app, fake_io, no_disk):
         """Test that adding a todo with empty title is rejected."""
-        with patch("builtins.input") as mock_input:
-            mock_input.return_value = ""  # empty title
-            with patch("builtins.print"):
-                app.handle_add_todo()
+        fake_io([""])  # empty title
+        app.handle_add_todo()
 
         # Verify no todo was added
         todos = app.todo_manager.get_user_todos("testuser")
         assert len(todos) == 0
 
-    def test_handle_add_todo_with_invalid_priority_defaults_to_mid(self, app):
+    def test_handle_add_todo_with_invalid_priority_defaults_to_mid(self, app, fake_io, no_disk):
         """Test that invalid priority defaults to MID."""
-        with patch("builtins.input") as mock_input:
-            mock_input.side_effect = [
-                "Test Task",  # title
-                "Details",  # details
-                "INVALID_PRIORITY",  # invalid priority
-                "",  # due_date
-            ]
-            with patch("builtins.print"):
-                app.handle_add_todo()
+        fake_io(["Test Task", "Details", "INVALID_PRIORITY", ""])
+        app.handle_add_todo()
 
         # Verify todo was added with MID priority
         todos = app.todo_manager.get_user_todos("testuser")
         assert len(todos) == 1
         assert todos[0].priority == Priority.MID
 
-    def test_handle_edit_todo_title(self, app):
+    def test_handle_edit_todo_title(self, app, fake_io, no_disk):
         """Test editing a todo's title through the app interface."""
         # Add a todo first
         todo = TodoItem(
@@ -512,23 +555,15 @@ class TestTodoAppIntegration:
         )
         app.todo_manager.add_todo(todo)
 
-        # Mock user input for editing
-        with patch("builtins.input") as mock_input:
-            mock_input.side_effect = [
-                "1",  # select first todo
-                "New Title",  # new title
-                "",  # keep details
-                "",  # keep priority
-                "",  # keep due date
-            ]
-            with patch("builtins.print"):
-                app.handle_edit_todo()
+        # select first todo, new title, keep details/priority/due date
+        fake_io(["1", "New Title", "", "", ""])
+        app.handle_edit_todo()
 
         # Verify todo was updated
         todos = app.todo_manager.get_user_todos("testuser")
         assert todos[0].title == "New Title"
 
-    def test_handle_edit_todo_priority(self, app):
+    def test_handle_edit_todo_priority(self, app, fake_io, no_disk):
         """Test editing a todo's priority through the app interface."""
         # Add a todo first
         todo = TodoItem(
@@ -540,32 +575,21 @@ class TestTodoAppIntegration:
         )
         app.todo_manager.add_todo(todo)
 
-        # Mock user input for editing
-        with patch("builtins.input") as mock_input:
-            mock_input.side_effect = [
-                "1",  # select first todo
-                "",  # keep title
-                "",  # keep details
-                "LOW",  # new priority
-                "",  # keep due date
-            ]
-            with patch("builtins.print"):
-                app.handle_edit_todo()
+        # select first todo, keep title/details, new priority, keep due date
+        fake_io(["1", "", "", "LOW", ""])
+        app.handle_edit_todo()
 
         # Verify todo was updated
         todos = app.todo_manager.get_user_todos("testuser")
         assert todos[0].priority == Priority.LOW
 
-    def test_handle_edit_todo_with_no_todos(self, app):
+    def test_handle_edit_todo_with_no_todos(self, app, fake_io, no_disk):
         """Test that editing is not possible when user has no todos."""
-        with patch("builtins.print") as mock_print:
-            app.handle_edit_todo()
-            # Verify appropriate message was printed
-            assert any(
-                "no todos" in str(call).lower() for call in mock_print.call_args_list
-            )
+        app.handle_edit_todo()
+        # Verify appropriate message was printed
+        assert any("no todos" in line.lower() for line in fake_io.outputs)
 
-    def test_handle_edit_todo_with_invalid_selection(self, app):
+    def test_handle_edit_todo_with_invalid_selection(self, app, fake_io, no_disk):
         """Test handling invalid todo selection during editing."""
         # Add a todo first
         todo = TodoItem(
@@ -577,12 +601,7 @@ class TestTodoAppIntegration:
         )
         app.todo_manager.add_todo(todo)
 
-        # Mock user input with invalid selection
-        with patch("builtins.input") as mock_input:
-            mock_input.return_value = "999"  # invalid selection
-            with patch("builtins.print") as mock_print:
-                app.handle_edit_todo()
-            # Verify error message
-            assert any(
-                "invalid" in str(call).lower() for call in mock_print.call_args_list
-            )
+        fake_io(["999"])  # invalid selection
+        app.handle_edit_todo()
+        # Verify error message
+        assert any("invalid" in line.lower() for line in fake_io.outputs)
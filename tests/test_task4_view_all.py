@@ -1,520 +1,356 @@
 """Unit tests for Task 4: View All To-Do List Items functionality."""
 
-from datetime import datetime
-from unittest.mock import patch, MagicMock
+import dataclasses
+import functools
 
 import pytest
 
 from src.models import TodoItem, Priority, Status
-from src.main import App
-
-
-class TestViewAllTodos:
-    """Test suite for viewing all to-do items."""
-
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.app = App()
-        self.app.current_user = "testuser"
-        # Mock the todo_manager
-        self.app.todo_manager = MagicMock()
-
-    @patch("builtins.print")
-    def test_no_todos_message(self, mock_print):
-        """Test viewing todos when user has no todos."""
-        # Mock empty todos list
-        self.app.todo_manager.get_user_todos.return_value = []
-
-        # Call the method
-        self.app.handle_view_todos()
-
-        # Check that get_user_todos was called with the current user
-        self.app.todo_manager.get_user_todos.assert_called_once_with("testuser")
-
-        # Check that appropriate message is printed
-        mock_print.assert_called_once_with("You have no todos yet.")
-
-    @patch("builtins.print")
-    def test_single_todo_display(self, mock_print):
-        """Test viewing todos with a single todo item."""
-        # Create a single todo
-        todo = TodoItem(
-            id="test-id-001",
-            title="Buy groceries",
-            details="Milk, bread, eggs",
-            priority=Priority.MID,
-            status=Status.PENDING,
-            owner="testuser",
-            created_at="2025-01-20T08:00:00",
-            updated_at="2025-01-20T08:00:00",
-            due_date="2025-01-21",
-        )
-
-        # Mock todos list
-        self.app.todo_manager.get_user_todos.return_value = [todo]
-
-        # Call the method
-        self.app.handle_view_todos()
-
-        # Check that get_user_todos was called
-        self.app.todo_manager.get_user_todos.assert_called_once_with("testuser")
-
-        # Check that header is printed
-        mock_print.assert_any_call("\n=== YOUR TODOS ===")
-
-        # Check that todo title is printed
-        mock_print.assert_any_call("\n1. Buy groceries (Due: 2025-01-21)")
-
-        # Check that status is printed
-        mock_print.assert_any_call("   Status: PENDING")
-
-        # Check that priority is printed
-        mock_print.assert_any_call("   Priority: MID")
-
-        # Check that details are printed
-        mock_print.assert_any_call("   Details: Milk, bread, eggs")
-
-        # Check that created date is printed
-        mock_print.assert_any_call("   Created: 2025-01-20T08:00:00")
-
-    @patch("builtins.print")
-    def test_todo_without_details(self, mock_print):
-        """Test viewing a todo without details field."""
-        # Create a todo without details
-        todo = TodoItem(
-            id="test-id-002",
-            title="Call dentist",
-            details="",  # Empty details
-            priority=Priority.HIGH,
-            status=Status.PENDING,
-            owner="testuser",
-            created_at="2025-01-20T09:00:00",
-            updated_at="2025-01-20T09:00:00",
-        )
-
-        # Mock todos list
-        self.app.todo_manager.get_user_todos.return_value = [todo]
-
-        # Call the method
-        self.app.handle_view_todos()
-
-        # Check that the details line is NOT printed when empty
-        calls = [str(call) for call in mock_print.call_args_list]
-        details_printed = any("Details:" in str(call) for call in calls)
-        assert not details_printed
-
-    @patch("builtins.print")
-    def test_todo_without_due_date(self, mock_print):
-        """Test viewing a todo without a due date."""
-        # Create a todo without due_date
-        todo = TodoItem(
-            id="test-id-003",
-            title="Read a book",
-            details="Fiction novel",
-            priority=Priority.LOW,
-            status=Status.COMPLETED,
-            owner="testuser",
-            created_at="2025-01-19T10:00:00",
-            updated_at="2025-01-20T15:30:00",
-            due_date=None,
-        )
-
-        # Mock todos list
-        self.app.todo_manager.get_user_todos.return_value = [todo]
-
-        # Call the method
-        self.app.handle_view_todos()
-
-        # Check that todo title is printed without due date suffix
-        mock_print.assert_any_call("\n1. Read a book")
-
-    @patch("builtins.print")
-    def test_multiple_todos_sorted_by_creation_time(self, mock_print):
-        """Test viewing multiple todos sorted by creation time (newest first)."""
-        # Create todos with different creation times
-        old_todo = TodoItem(
-            id="test-id-old",
-            title="Old task",
-            details="Created earlier",
-            priority=Priority.LOW,
-            status=Status.COMPLETED,
-            owner="testuser",
-            created_at="2025-01-18T08:00:00",
-            updated_at="2025-01-18T08:00:00",
-        )
-
-        new_todo = TodoItem(
-            id="test-id-new",
-            title="New task",
-            details="Created recently",
-            priority=Priority.HIGH,
-            status=Status.PENDING,
-            owner="testuser",
-            created_at="2025-01-20T15:00:00",
-            updated_at="2025-01-20T15:00:00",
-        )
 
-        mid_todo = TodoItem(
-            id="test-id-mid",
-            title="Middle task",
-            details="Created in between",
+# Canonical todo; tests derive variants via dataclasses.replace instead of
+# retyping the full keyword list for every instance.
+_BASE_TODO = TodoItem(
+    id="base",
+    title="Base task",
+    details="",
+    priority=Priority.MID,
+    status=Status.PENDING,
+    owner="testuser",
+    created_at="2025-01-20T10:00:00",
+    updated_at="2025-01-20T10:00:00",
+)
+
+
+# One timestamp per January day; the stress-list factory indexes this
+# instead of re-running the f-string format for every todo.
+_DATES = tuple(f"2025-01-{d:02d}T10:00:00" for d in range(1, 32))
+
+
+@functools.lru_cache(maxsize=1)
+def _big_todo_list(n=50):
+    """Build the stress-test todo list once and reuse it across runs."""
+    return [
+        TodoItem(
+            id=f"id-{i}",
+            title=f"Task {i}",
+            details=f"Details for task {i}",
             priority=Priority.MID,
-            status=Status.PENDING,
-            owner="testuser",
-            created_at="2025-01-19T12:00:00",
-            updated_at="2025-01-19T12:00:00",
-        )
-
-        # Return todos in non-sorted order
-        self.app.todo_manager.get_user_todos.return_value = [
-            old_todo,
-            mid_todo,
-            new_todo,
-        ]
-
-        # Call the method
-        self.app.handle_view_todos()
-
-        # Get all the print calls
-        print_calls = [str(call) for call in mock_print.call_args_list]
-
-        # Find the indices of each todo title in the output
-        new_task_index = next(
-            i
-            for i, call in enumerate(print_calls)
-            if "New task" in str(call)
-        )
-        mid_task_index = next(
-            i
-            for i, call in enumerate(print_calls)
-            if "Middle task" in str(call)
-        )
-        old_task_index = next(
-            i
-            for i, call in enumerate(print_calls)
-            if "Old task" in str(call)
-        )
-
-        # Verify they're in the correct order (newest first)
-        assert new_task_index < mid_task_index < old_task_index
-
-    @patch("builtins.print")
-    def test_all_priority_levels_displayed(self, mock_print):
-        """Test that all priority levels are correctly displayed."""
-        # Create todos with different priorities
-        high_priority_todo = TodoItem(
-            id="test-high",
-            title="Urgent task",
-            details="",
-            priority=Priority.HIGH,
-            status=Status.PENDING,
+            status=Status.PENDING if i % 2 == 0 else Status.COMPLETED,
             owner="testuser",
-            created_at="2025-01-20T10:00:00",
-            updated_at="2025-01-20T10:00:00",
+            created_at=_DATES[i % 31],
+            updated_at=_DATES[i % 31],
+            due_date=None,
         )
-
-        mid_priority_todo = TodoItem(
-            id="test-mid",
-            title="Normal task",
-            details="",
-            priority=Priority.MID,
-            status=Status.PENDING,
-            owner="testuser",
-            created_at="2025-01-20T10:05:00",
-            updated_at="2025-01-20T10:05:00",
+        for i in range(1, n + 1)
+    ]
+
+
+def test_no_todos_message(app, mock_print):
+    """Test viewing todos when user has no todos."""
+    # Mock empty todos list
+    app.todo_manager.get_user_todos.return_value = []
+
+    # Call the method
+    app.handle_view_todos()
+
+    # Check that get_user_todos was called with the current user
+    fetched = app.todo_manager.get_user_todos
+    assert fetched.call_count == 1 and fetched.call_args.args == ("testuser",)
+
+    # Check that appropriate message is printed
+    assert mock_print.call_count == 1
+    assert mock_print.call_args.args == ("You have no todos yet.",)
+
+
+def test_single_todo_display(app, mock_print, sample_todos):
+    """Test viewing todos with a single todo item."""
+    # Mock todos list
+    app.todo_manager.get_user_todos.return_value = [sample_todos["with_due"]]
+
+    # Call the method
+    app.handle_view_todos()
+
+    # Check that get_user_todos was called
+    fetched = app.todo_manager.get_user_todos
+    assert fetched.call_count == 1 and fetched.call_args.args == ("testuser",)
+
+    # Collect the printed lines once; each expected line is then a
+    # set lookup instead of an assert_any_call scan of the call list.
+    printed = {c.args for c in mock_print.call_args_list}
+    assert ("\n=== YOUR TODOS ===",) in printed
+    assert ("\n1. Buy groceries (Due: 2025-01-21)",) in printed
+    assert ("   Status: PENDING",) in printed
+    assert ("   Priority: MID",) in printed
+    assert ("   Details: Milk, bread, eggs",) in printed
+    assert ("   Created: 2025-01-20T08:00:00",) in printed
+
+
+@pytest.mark.parametrize(
+    "shape,expected_line",
+    [
+        # Empty details: no Details line at all
+        ("no_details", None),
+        # No due date: title printed without the due-date suffix
+        ("no_due", "\n1. Read a book"),
+        # Due date present: formatted as "(Due: YYYY-MM-DD)"
+        ("deadline", "\n1. Important deadline (Due: 2025-02-15)"),
+    ],
+)
+def test_single_todo_field_variants(
+    app, mock_print, shape, expected_line, sample_todos
+):
+    """Test optional-field display for a single todo (details/due date)."""
+    # Mock todos list
+    app.todo_manager.get_user_todos.return_value = [sample_todos[shape]]
+
+    # Call the method
+    app.handle_view_todos()
+
+    if expected_line is None:
+        # Check that the details line is NOT printed when empty
+        assert all(
+            "Details:" not in c.args[0]
+            for c in mock_print.call_args_list
+            if c.args
         )
-
-        low_priority_todo = TodoItem(
+    else:
+        printed = {c.args for c in mock_print.call_args_list}
+        assert (expected_line,) in printed
+
+
+def test_multiple_todos_sorted_by_creation_time(app, mock_print):
+    """Test viewing multiple todos sorted by creation time (newest first)."""
+    # Create todos with different creation times
+    old_todo = dataclasses.replace(
+        _BASE_TODO,
+        id="test-id-old",
+        title="Old task",
+        status=Status.COMPLETED,
+        created_at="2025-01-18T08:00:00",
+    )
+    new_todo = dataclasses.replace(
+        _BASE_TODO,
+        id="test-id-new",
+        title="New task",
+        created_at="2025-01-20T15:00:00",
+    )
+    mid_todo = dataclasses.replace(
+        _BASE_TODO,
+        id="test-id-mid",
+        title="Middle task",
+        created_at="2025-01-19T12:00:00",
+    )
+
+    # Return todos in non-sorted order
+    app.todo_manager.get_user_todos.return_value = [
+        old_todo,
+        mid_todo,
+        new_todo,
+    ]
+
+    # Call the method
+    app.handle_view_todos()
+
+    # Find the indices of each todo title in one pass over the output
+    indices = {}
+    titles = ("New task", "Middle task", "Old task")
+    for i, call in enumerate(mock_print.call_args_list):
+        line = call.args[0] if call.args else ""
+        for title in titles:
+            if title not in indices and title in line:
+                indices[title] = i
+
+    # Verify they're in the correct order (newest first)
+    assert indices["New task"] < indices["Middle task"] < indices["Old task"]
+
+
+def test_all_priority_levels_displayed(app, mock_print):
+    """Test that all priority levels are correctly displayed."""
+    # Create todos with different priorities
+    app.todo_manager.get_user_todos.return_value = [
+        dataclasses.replace(
+            _BASE_TODO, id="test-high", title="Urgent task", priority=Priority.HIGH
+        ),
+        dataclasses.replace(_BASE_TODO, id="test-mid", title="Normal task"),
+        dataclasses.replace(
+            _BASE_TODO,
             id="test-low",
             title="Low priority task",
-            details="",
             priority=Priority.LOW,
-            status=Status.PENDING,
-            owner="testuser",
-            created_at="2025-01-20T10:10:00",
-            updated_at="2025-01-20T10:10:00",
-        )
-
-        # Mock todos list
-        self.app.todo_manager.get_user_todos.return_value = [
-            high_priority_todo,
-            mid_priority_todo,
-            low_priority_todo,
-        ]
-
-        # Call the method
-        self.app.handle_view_todos()
-
-        # Check that all priorities are displayed
-        mock_print.assert_any_call("   Priority: HIGH")
-        mock_print.assert_any_call("   Priority: MID")
-        mock_print.assert_any_call("   Priority: LOW")
-
-    @patch("builtins.print")
-    def test_all_status_levels_displayed(self, mock_print):
-        """Test that all status levels are correctly displayed."""
-        # Create todos with different statuses
-        pending_todo = TodoItem(
-            id="test-pending",
-            title="Pending task",
-            details="",
-            priority=Priority.MID,
-            status=Status.PENDING,
-            owner="testuser",
-            created_at="2025-01-20T10:00:00",
-            updated_at="2025-01-20T10:00:00",
-        )
-
-        completed_todo = TodoItem(
+        ),
+    ]
+
+    # Call the method
+    app.handle_view_todos()
+
+    # Check that all priorities are displayed
+    printed = {c.args for c in mock_print.call_args_list}
+    assert ("   Priority: HIGH",) in printed
+    assert ("   Priority: MID",) in printed
+    assert ("   Priority: LOW",) in printed
+
+
+def test_all_status_levels_displayed(app, mock_print):
+    """Test that all status levels are correctly displayed."""
+    # Create todos with different statuses
+    app.todo_manager.get_user_todos.return_value = [
+        dataclasses.replace(_BASE_TODO, id="test-pending", title="Pending task"),
+        dataclasses.replace(
+            _BASE_TODO,
             id="test-completed",
             title="Completed task",
-            details="",
-            priority=Priority.MID,
             status=Status.COMPLETED,
-            owner="testuser",
             created_at="2025-01-19T10:00:00",
-            updated_at="2025-01-20T10:00:00",
-        )
-
-        # Mock todos list
-        self.app.todo_manager.get_user_todos.return_value = [
-            pending_todo,
-            completed_todo,
-        ]
-
-        # Call the method
-        self.app.handle_view_todos()
-
-        # Check that both statuses are displayed
-        mock_print.assert_any_call("   Status: PENDING")
-        mock_print.assert_any_call("   Status: COMPLETED")
-
-    @patch("builtins.print")
-    def test_multiple_todos_with_various_combinations(self, mock_print):
-        """Test viewing multiple todos with various field combinations."""
-        todos = [
-            TodoItem(
-                id="id-1",
-                title="Task with all fields",
-                details="Complete information",
-                priority=Priority.HIGH,
-                status=Status.PENDING,
-                owner="testuser",
-                created_at="2025-01-20T10:00:00",
-                updated_at="2025-01-20T10:00:00",
-                due_date="2025-01-22",
-            ),
-            TodoItem(
-                id="id-2",
-                title="Task with minimal fields",
-                details="",
-                priority=Priority.LOW,
-                status=Status.COMPLETED,
-                owner="testuser",
-                created_at="2025-01-19T10:00:00",
-                updated_at="2025-01-19T10:00:00",
-                due_date=None,
-            ),
-            TodoItem(
-                id="id-3",
-                title="Task without due date",
-                details="Some details here",
-                priority=Priority.MID,
-                status=Status.PENDING,
-                owner="testuser",
-                created_at="2025-01-18T10:00:00",
-                updated_at="2025-01-18T10:00:00",
-                due_date=None,
-            ),
-        ]
-
-        # Mock todos list
-        self.app.todo_manager.get_user_todos.return_value = todos
-
-        # Call the method
-        self.app.handle_view_todos()
-
-        # Get all print calls
-        all_calls = mock_print.call_args_list
-        call_strings = [str(call) for call in all_calls]
-
-        # Check that all three todos are displayed
-        assert any("Task with all fields" in str(call) for call in call_strings)
-        assert any("Task with minimal fields" in str(call) for call in call_strings)
-        assert any("Task without due date" in str(call) for call in call_strings)
-
-        # Check that all todos have correct status and priority
-        assert any("HIGH" in str(call) for call in call_strings)
-        assert any("LOW" in str(call) for call in call_strings)
-        assert any("MID" in str(call) for call in call_strings)
-
-    @patch("builtins.print")
-    def test_todos_numbered_correctly(self, mock_print):
-        """Test that todos are numbered sequentially starting from 1."""
-        todos = [
-            TodoItem(
-                id="id-1",
-                title="First task",
-                details="",
-                priority=Priority.MID,
-                status=Status.PENDING,
-                owner="testuser",
-                created_at="2025-01-20T10:00:00",
-                updated_at="2025-01-20T10:00:00",
-            ),
-            TodoItem(
-                id="id-2",
-                title="Second task",
-                details="",
-                priority=Priority.MID,
-                status=Status.PENDING,
-                owner="testuser",
-                created_at="2025-01-20T11:00:00",
-                updated_at="2025-01-20T11:00:00",
-            ),
-            TodoItem(
-                id="id-3",
-                title="Third task",
-                details="",
-                priority=Priority.MID,
-                status=Status.PENDING,
-                owner="testuser",
-                created_at="2025-01-20T12:00:00",
-                updated_at="2025-01-20T12:00:00",
-            ),
-        ]
-
-        # Mock todos list
-        self.app.todo_manager.get_user_todos.return_value = todos
-
-        # Call the method
-        self.app.handle_view_todos()
-
-        # Check that todos are numbered (they are sorted by creation time - newest first)
-        # So the order should be: Third task (1), Second task (2), First task (3)
-        mock_print.assert_any_call("\n1. Third task")
-        mock_print.assert_any_call("\n2. Second task")
-        mock_print.assert_any_call("\n3. First task")
-
-    @patch("builtins.print")
-    def test_formatting_with_due_dates(self, mock_print):
-        """Test that due dates are formatted correctly in the display."""
-        todo = TodoItem(
-            id="test-id",
-            title="Important deadline",
-            details="Project completion",
+        ),
+    ]
+
+    # Call the method
+    app.handle_view_todos()
+
+    # Check that both statuses are displayed
+    printed = {c.args for c in mock_print.call_args_list}
+    assert ("   Status: PENDING",) in printed
+    assert ("   Status: COMPLETED",) in printed
+
+
+def test_multiple_todos_with_various_combinations(app, mock_print):
+    """Test viewing multiple todos with various field combinations."""
+    todos = [
+        dataclasses.replace(
+            _BASE_TODO,
+            id="id-1",
+            title="Task with all fields",
+            details="Complete information",
             priority=Priority.HIGH,
-            status=Status.PENDING,
-            owner="testuser",
-            created_at="2025-01-15T09:00:00",
-            updated_at="2025-01-15T09:00:00",
-            due_date="2025-02-15",
-        )
-
-        # Mock todos list
-        self.app.todo_manager.get_user_todos.return_value = [todo]
-
-        # Call the method
-        self.app.handle_view_todos()
-
-        # Check that due date is formatted correctly as "(Due: YYYY-MM-DD)"
-        mock_print.assert_any_call("\n1. Important deadline (Due: 2025-02-15)")
-
-    @patch("builtins.print")
-    def test_todos_retrieved_for_correct_user(self, mock_print):
-        """Test that todos are retrieved only for the current user."""
-        # Create app with specific user
-        self.app.current_user = "specific_user"
-
-        todos = [
-            TodoItem(
-                id="id-1",
-                title="User task",
-                details="",
-                priority=Priority.MID,
-                status=Status.PENDING,
-                owner="specific_user",
-                created_at="2025-01-20T10:00:00",
-                updated_at="2025-01-20T10:00:00",
-            ),
-        ]
-
-        # Mock todos list
-        self.app.todo_manager.get_user_todos.return_value = todos
-
-        # Call the method
-        self.app.handle_view_todos()
-
-        # Verify that get_user_todos was called with the correct username
-        self.app.todo_manager.get_user_todos.assert_called_once_with("specific_user")
-
-    @patch("builtins.print")
-    def test_created_date_always_displayed(self, mock_print):
-        """Test that created date is always displayed for all todos."""
-        todos = [
-            TodoItem(
-                id="id-1",
-                title="Task 1",
-                details="",
-                priority=Priority.MID,
-                status=Status.PENDING,
-                owner="testuser",
-                created_at="2025-01-20T08:30:00",
-                updated_at="2025-01-20T08:30:00",
-            ),
-            TodoItem(
-                id="id-2",
-                title="Task 2",
-                details="",
-                priority=Priority.MID,
-                status=Status.PENDING,
-                owner="testuser",
-                created_at="2025-01-19T14:45:00",
-                updated_at="2025-01-19T14:45:00",
-            ),
-        ]
-
-        # Mock todos list
-        self.app.todo_manager.get_user_todos.return_value = todos
-
-        # Call the method
-        self.app.handle_view_todos()
-
-        # Check that created dates are displayed
-        mock_print.assert_any_call("   Created: 2025-01-20T08:30:00")
-        mock_print.assert_any_call("   Created: 2025-01-19T14:45:00")
-
-    @patch("builtins.print")
-    def test_large_number_of_todos(self, mock_print):
-        """Test viewing a large number of todos."""
-        # Create 50 todos
-        todos = [
-            TodoItem(
-                id=f"id-{i}",
-                title=f"Task {i}",
-                details=f"Details for task {i}",
-                priority=Priority.MID,
-                status=Status.PENDING if i % 2 == 0 else Status.COMPLETED,
-                owner="testuser",
-                created_at=f"2025-01-{(i % 31) + 1:02d}T10:00:00",
-                updated_at=f"2025-01-{(i % 31) + 1:02d}T10:00:00",
-                due_date=None,
-            )
-            for i in range(1, 51)
-        ]
-
-        # Mock todos list
-        self.app.todo_manager.get_user_todos.return_value = todos
-
-        # Call the method
-        self.app.handle_view_todos()
-
-        # Get the print calls
-        all_calls = [str(call) for call in mock_print.call_args_list]
-
-        # Verify get_user_todos was called
-        self.app.todo_manager.get_user_todos.assert_called_once_with("testuser")
-
-        # Verify that the method completes without error
-        # and that the header was printed
-        assert any("YOUR TODOS" in call for call in all_calls)
+            due_date="2025-01-22",
+        ),
+        dataclasses.replace(
+            _BASE_TODO,
+            id="id-2",
+            title="Task with minimal fields",
+            priority=Priority.LOW,
+            status=Status.COMPLETED,
+            created_at="2025-01-19T10:00:00",
+        ),
+        dataclasses.replace(
+            _BASE_TODO,
+            id="id-3",
+            title="Task without due date",
+            details="Some details here",
+            created_at="2025-01-18T10:00:00",
+        ),
+    ]
+
+    # Mock todos list
+    app.todo_manager.get_user_todos.return_value = todos
+
+    # Call the method
+    app.handle_view_todos()
+
+    # Join the output once; each substring check is then a single
+    # C-level scan instead of a per-call generator pass.
+    joined = "\n".join(c.args[0] for c in mock_print.call_args_list if c.args)
+
+    # Check that all three todos are displayed
+    assert "Task with all fields" in joined
+    assert "Task with minimal fields" in joined
+    assert "Task without due date" in joined
+
+    # Check that all todos have correct status and priority
+    assert "HIGH" in joined
+    assert "LOW" in joined
+    assert "MID" in joined
+
+
+def test_todos_numbered_correctly(app, mock_print):
+    """Test that todos are numbered sequentially starting from 1."""
+    todos = [
+        dataclasses.replace(
+            _BASE_TODO, id="id-1", title="First task", created_at="2025-01-20T10:00:00"
+        ),
+        dataclasses.replace(
+            _BASE_TODO, id="id-2", title="Second task", created_at="2025-01-20T11:00:00"
+        ),
+        dataclasses.replace(
+            _BASE_TODO, id="id-3", title="Third task", created_at="2025-01-20T12:00:00"
+        ),
+    ]
+
+    # Mock todos list
+    app.todo_manager.get_user_todos.return_value = todos
+
+    # Call the method
+    app.handle_view_todos()
+
+    # Check that todos are numbered (they are sorted by creation time - newest first)
+    # So the order should be: Third task (1), Second task (2), First task (3)
+    printed = {c.args for c in mock_print.call_args_list}
+    assert ("\n1. Third task",) in printed
+    assert ("\n2. Second task",) in printed
+    assert ("\n3. First task",) in printed
+
+
+def test_todos_retrieved_for_correct_user(app, mock_print):
+    """Test that todos are retrieved only for the current user."""
+    # Create app with specific user
+    app.current_user = "specific_user"
+
+    todos = [
+        dataclasses.replace(
+            _BASE_TODO, id="id-1", title="User task", owner="specific_user"
+        ),
+    ]
+
+    # Mock todos list
+    app.todo_manager.get_user_todos.return_value = todos
+
+    # Call the method
+    app.handle_view_todos()
+
+    # Verify that get_user_todos was called with the correct username
+    fetched = app.todo_manager.get_user_todos
+    assert fetched.call_count == 1 and fetched.call_args.args == ("specific_user",)
+
+
+def test_created_date_always_displayed(app, mock_print):
+    """Test that created date is always displayed for all todos."""
+    todos = [
+        dataclasses.replace(
+            _BASE_TODO, id="id-1", title="Task 1", created_at="2025-01-20T08:30:00"
+        ),
+        dataclasses.replace(
+            _BASE_TODO, id="id-2", title="Task 2", created_at="2025-01-19T14:45:00"
+        ),
+    ]
+
+    # Mock todos list
+    app.todo_manager.get_user_todos.return_value = todos
+
+    # Call the method
+    app.handle_view_todos()
+
+    # Check that created dates are displayed
+    printed = {c.args for c in mock_print.call_args_list}
+    assert ("   Created: 2025-01-20T08:30:00",) in printed
+    assert ("   Created: 2025-01-19T14:45:00",) in printed
+
+
+@pytest.mark.slow
+def test_large_number_of_todos(app, mock_print):
+    """Test viewing a large number of todos."""
+    # Mock todos list (50 todos, built once per session by the factory)
+    app.todo_manager.get_user_todos.return_value = _big_todo_list()
+
+    # Call the method
+    app.handle_view_todos()
+
+    # Join the output once for the substring check
+    joined = "\n".join(c.args[0] for c in mock_print.call_args_list if c.args)
+
+    # Verify get_user_todos was called
+    fetched = app.todo_manager.get_user_todos
+    assert fetched.call_count == 1 and fetched.call_args.args == ("testuser",)
+
+    # Verify that the method completes without error
+    # and that the header was printed
+    assert "YOUR TODOS" in joined